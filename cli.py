@@ -79,6 +79,11 @@ def send_and_offer(
         "--debug",
         help="Enable DEBUG logging",
     ),
+    fast_fill: bool = typer.Option(
+        False,
+        "--fast-fill",
+        help="Fill the offer form in one step instead of field by field (less human-like)",
+    ),
 ):
     """
     Send a message to a Kleinanzeigen listing and make an offer.
@@ -128,6 +133,7 @@ def send_and_offer(
     
     # Set debug mode
     bot.debug_mode = debug
+    bot.fast_fill = fast_fill
     
     # Execute workflow
     try:
@@ -18,7 +18,16 @@ from src.selectors import (
     PASSWORD_FIELD,
     LOGIN_SUBMIT,
 )
-from src.utils import safe_click, safe_fill, take_screenshot, random_delay
+from src.utils import (
+    safe_click,
+    safe_fill,
+    take_screenshot,
+    take_screenshot_in_background,
+    has_banner_handler,
+    prioritize_selectors,
+    remember_selector,
+    random_delay,
+)
 
 
 async def save_cookies(context: BrowserContext) -> bool:
@@ -133,6 +142,10 @@ async def accept_cookie_banner(page: Page) -> bool:
     Returns:
         True if banner was found and accepted, False otherwise
     """
+    if has_banner_handler(page):
+        logger.debug("Cookie banner is handled by the locator handler")
+        return False
+    
     try:
         logger.debug("Checking for cookie banner...")
         clicked = await safe_click(
@@ -271,16 +284,16 @@ async def login(
         
         # First, try standard selectors
         submit_clicked = False
-        for selector in LOGIN_SUBMIT:
+        for selector in prioritize_selectors(page, LOGIN_SUBMIT):
             try:
                 logger.debug(f"Trying submit selector: {selector}")
                 submit_button = await page.wait_for_selector(selector, timeout=5000, state="visible")
                 if submit_button:
-                    is_visible = await submit_button.is_visible()
+                    # state="visible" already guarantees visibility
                     is_enabled = await submit_button.is_enabled()
-                    logger.debug(f"Submit button found - visible: {is_visible}, enabled: {is_enabled}")
+                    logger.debug(f"Submit button found - enabled: {is_enabled}")
                     
-                    if is_visible and is_enabled:
+                    if is_enabled:
                         await submit_button.scroll_into_view_if_needed()
                         await random_delay(1.5, 3.0)  # Longer delay before click (human behavior)
                         
@@ -289,6 +302,7 @@ async def login(
                             # First try: Normal click
                             await submit_button.click(timeout=5000, force=False)
                             logger.info(f"✅ Submit button clicked with: {selector}")
+                            remember_selector(page, LOGIN_SUBMIT, selector)
                             submit_clicked = True
                             break
                         except Exception as e:
@@ -297,6 +311,7 @@ async def login(
                                 # Second try: JavaScript click (more reliable)
                                 await submit_button.evaluate("el => { el.focus(); el.click(); }")
                                 logger.info(f"✅ Submit button clicked via JavaScript: {selector}")
+                                remember_selector(page, LOGIN_SUBMIT, selector)
                                 submit_clicked = True
                                 break
                             except Exception as e2:
@@ -305,6 +320,7 @@ async def login(
                                     # Third try: Force click
                                     await submit_button.click(timeout=5000, force=True)
                                     logger.info(f"✅ Submit button clicked with force: {selector}")
+                                    remember_selector(page, LOGIN_SUBMIT, selector)
                                     submit_clicked = True
                                     break
                                 except Exception as e3:
@@ -453,11 +469,9 @@ async def login(
             try:
                 element = await page.wait_for_selector(indicator, timeout=3000)
                 if element:
-                    is_visible = await element.is_visible()
-                    if is_visible:
-                        logger.info(f"✅ Login successful! Found logged-in indicator: {indicator}")
-                        login_successful = True
-                        break
+                    logger.info(f"✅ Login successful! Found logged-in indicator: {indicator}")
+                    login_successful = True
+                    break
             except:
                 continue
         
@@ -524,11 +538,11 @@ async def login(
             return True
         else:
             logger.warning("Could not verify login with selectors, but URL changed - assuming success")
-            await take_screenshot(page, prefix="login_unverified")
+            take_screenshot_in_background(page, prefix="login_unverified")
             return True
         
     except Exception as e:
         logger.error(f"Login failed with error: {e}")
-        await take_screenshot(page, prefix="login_error")
+        await take_screenshot(page, prefix="login_error", full_page=True)
         return False
 
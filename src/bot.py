@@ -3,7 +3,9 @@ Core bot class with full workflow: login, send message, navigate conversation, m
 """
 
 import asyncio
-from typing import Dict, Optional
+import re
+import traceback
+from typing import Dict, FrozenSet, Optional
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 from loguru import logger
@@ -12,6 +14,7 @@ from src.config import (
     TIMEOUTS,
     DELIVERY_OPTIONS,
     BROWSER_ARGS,
+    TYPING_DELAY_MS,
     EXIT_SUCCESS,
     EXIT_LOGIN_FAILED,
     EXIT_MESSAGE_FAILED,
@@ -23,29 +26,50 @@ from src.config import (
 from src.auth import login, save_cookies, load_cookies
 from src.selectors import (
     MESSAGE_BUTTON,
+    MESSAGE_BUTTON_UNION,
+    MESSAGE_MODAL,
     MESSAGE_TEXTAREA,
     MESSAGE_SEND,
     CONVERSATIONS_PAGE,
     LATEST_CONVERSATION,
+    LATEST_CONVERSATION_UNION,
     OFFER_BUTTON,
+    OFFER_MODAL_UNION,
     OFFER_PRICE_INPUT,
     OFFER_DELIVERY_SELECT,
     OFFER_SHIPPING_INPUT,
     OFFER_NOTE_TEXTAREA,
     OFFER_SUBMIT,
-    SUCCESS_INDICATOR,
 )
 from src.utils import (
     safe_click,
     safe_fill,
     safe_select,
     take_screenshot,
-    wait_for_selector_with_fallbacks,
+    take_screenshot_in_background,
+    wait_for_any_visible,
+    find_first_visible,
+    wait_for_background_tasks,
+    wait_success,
+    find_button,
+    install_banner_handler,
+    is_level_enabled,
+    patch_playwright,
+    type_in_browser,
+    prioritize_selectors,
+    remember_selector,
+    save_selector_stats,
     validate_url,
     random_delay,
 )
 from src.debug import debug_page_elements
 
+# URL fragments that indicate we ended up in the messaging area after sending
+_URL_SUCCESS_RE = re.compile(r"nachricht|messages", re.I)
+
+# Lowercase keywords identifying a message/contact button by its text
+_MESSAGE_KEYWORDS = frozenset({"nachricht", "kontakt", "schreiben"})
+
 
 class KleinanzeigenBot:
     """
@@ -73,6 +97,7 @@ class KleinanzeigenBot:
         self.headless = headless
         self.timeout = timeout
         self.debug_mode = False  # Will be set from CLI
+        self.fast_fill = False  # Will be set from CLI
         
         self.playwright = None
         self.browser: Optional[Browser] = None
@@ -90,6 +115,7 @@ class KleinanzeigenBot:
         """
         try:
             logger.info("Setting up browser with anti-detection...")
+            patch_playwright()
             self.playwright = await async_playwright().start()
             
             # Enhanced anti-detection args - make it look like a real browser
@@ -135,10 +161,9 @@ class KleinanzeigenBot:
                 },
             )
             
-            self.page = await self.context.new_page()
-            
             # Enhanced stealth mode: Hide all automation indicators
-            await self.page.add_init_script("""
+            # (registered on the context so every page opened from it gets it)
+            await self.context.add_init_script("""
                 // Hide webdriver property
                 Object.defineProperty(navigator, 'webdriver', {
                     get: () => undefined,
@@ -186,6 +211,9 @@ class KleinanzeigenBot:
                 });
             """)
             
+            self.page = await self.context.new_page()
+            await install_banner_handler(self.page)
+            
             logger.info("✅ Browser setup complete with anti-detection")
             return True
             
@@ -196,6 +224,8 @@ class KleinanzeigenBot:
     async def close(self) -> None:
         """Close browser and cleanup resources."""
         try:
+            await wait_for_background_tasks()
+            save_selector_stats()
             if self.browser:
                 await self.browser.close()
             if self.playwright:
@@ -270,22 +300,18 @@ class KleinanzeigenBot:
         try:
             logger.info(f"📝 Sending message to listing: {listing_url}")
             
-            # Navigate to listing - use domcontentloaded instead of networkidle (less strict)
+            # Navigate to listing - return as soon as the response commits and wait for
+            # the message button itself instead of load events plus fixed delays
             logger.debug("Navigating to listing page...")
             try:
-                await self.page.goto(listing_url, wait_until="domcontentloaded", timeout=30000)
+                await self.page.goto(listing_url, wait_until="commit", timeout=30000)
+                await self.page.locator(MESSAGE_BUTTON_UNION).first.wait_for(
+                    state="attached", timeout=15000
+                )
             except Exception as e:
                 logger.warning(f"Navigation timeout, but continuing: {e}")
                 # Page might still be usable
             
-            await random_delay(3, 5)  # Wait longer for page to fully load
-            
-            # Wait for page to be interactive
-            try:
-                await self.page.wait_for_load_state("load", timeout=10000)
-            except:
-                logger.debug("Load state timeout, continuing...")
-            
             # Debug mode: Analyze page after navigation
             if hasattr(self, 'debug_mode') and self.debug_mode:
                 await debug_page_elements(self.page, "after_navigation")
@@ -293,46 +319,31 @@ class KleinanzeigenBot:
             # Click message button - try multiple selectors with better waiting
             logger.info("🔍 Looking for message button...")
             
-            # First, wait a bit for page to fully render
-            await random_delay(2, 3)
-            
-            message_button_selectors = [
-                "button:has-text('Nachricht schreiben')",
-                "a:has-text('Nachricht schreiben')",
-                "button:has-text('Nachricht senden')",
-                "a:has-text('Nachricht senden')",
-                "button:has-text('Kontakt')",
-                "a:has-text('Kontakt')",
-                "a[href*='nachricht']",
-                "button[class*='contact']",
-                "button[class*='message']",
-                "a[class*='contact']",
-                "a[class*='message']",
-                "[data-testid*='contact']",
-                "[data-qa*='contact']",
-                "[data-gaaction*='contact']",
-                "button[id*='contact']",
-                "a[id*='contact']",
-            ]
-            
             message_clicked = False
-            for selector in message_button_selectors:
+            
+            # Fast path: role-based lookup by accessible name. The specific names
+            # go first; a bare "Kontakt" match could be an unrelated nav link.
+            button = await find_button(self.page, r"nachricht (schreiben|senden)", timeout=5)
+            if not button:
+                button = await find_button(self.page, r"^\s*kontakt", timeout=2)
+            if button:
                 try:
-                    logger.debug(f"Trying message button selector: {selector}")
-                    # Try with longer timeout and different states
-                    button = await self.page.wait_for_selector(
-                        selector, 
-                        timeout=8000, 
-                        state="visible"
-                    )
-                    if button:
-                        # Check if button is actually visible and clickable
-                        is_visible = await button.is_visible()
-                        if not is_visible:
-                            logger.debug(f"Button found but not visible: {selector}")
-                            continue
-                        
-                        await button.scroll_into_view_if_needed()
+                    await random_delay(0.5, 1.0)
+                    try:
+                        await button.click(timeout=5000)
+                    except:
+                        await button.evaluate("el => el.click()")
+                    logger.info("✅ Message button clicked via role lookup")
+                    message_clicked = True
+                except Exception as e:
+                    logger.debug(f"Role-based message button click failed: {e}")
+            
+            if not message_clicked and await wait_for_any_visible(self.page, MESSAGE_BUTTON, timeout=8):
+                # One wait for the whole group, then pick by priority rather than
+                # by whichever candidate rendered first
+                selector, button = await find_first_visible(self.page, MESSAGE_BUTTON)
+                if button:
+                    try:
                         await random_delay(0.5, 1.0)
                         
                         # Try clicking with different methods
@@ -343,28 +354,31 @@ class KleinanzeigenBot:
                             await button.evaluate("el => el.click()")
                         
                         logger.info(f"✅ Message button clicked with: {selector}")
+                        remember_selector(self.page, MESSAGE_BUTTON, selector)
                         message_clicked = True
-                        break
-                except Exception as e:
-                    logger.debug(f"Selector failed: {selector} - {e}")
-                    continue
+                    except Exception as e:
+                        logger.debug(f"Message button click failed: {e}")
             
             # If still not found, try to find ANY button/link with "Nachricht" or "Kontakt" text
             if not message_clicked:
                 logger.warning("Standard selectors failed, trying text-based search...")
                 try:
-                    # Find all buttons and links, check their text
-                    all_elements = await self.page.query_selector_all("button, a")
-                    for element in all_elements:
+                    # Read all button/link texts in one browser round-trip, check them here
+                    texts = await self.page.eval_on_selector_all(
+                        "button, a",
+                        "els => els.map(e => e.textContent || '')",
+                    )
+                    all_elements = self.page.locator("button, a")
+                    for index, text in enumerate(texts):
                         try:
-                            text = await element.text_content()
-                            if text and ("nachricht" in text.lower() or "kontakt" in text.lower() or "schreiben" in text.lower()):
+                            text_lower = text.lower()
+                            if any(keyword in text_lower for keyword in _MESSAGE_KEYWORDS):
+                                element = all_elements.nth(index)
                                 is_visible = await element.is_visible()
                                 if is_visible:
-                                    await element.scroll_into_view_if_needed()
                                     await random_delay(0.5, 1.0)
                                     await element.click(timeout=5000)
-                                    logger.info(f"✅ Message button clicked via text search: {text[:50]}")
+                                    logger.info(f"✅ Message button clicked via text search: {text.strip()[:50]}")
                                     message_clicked = True
                                     break
                         except:
@@ -374,9 +388,10 @@ class KleinanzeigenBot:
             
             if not message_clicked:
                 logger.error("❌ Could not find message button")
-                # Debug: Find all buttons on page
-                await debug_page_elements(self.page, "message_button_not_found")
                 await take_screenshot(self.page, prefix="message_button_error")
+                # Debug: Find all buttons on page (slow DOM walk, debug mode only)
+                if self.debug_mode:
+                    await debug_page_elements(self.page, "message_button_not_found")
                 return False
             
             # Wait for modal/form to appear with longer timeout
@@ -387,26 +402,9 @@ class KleinanzeigenBot:
             if self.debug_mode:
                 await debug_page_elements(self.page, "after_message_button_click")
             
-            # Try multiple approaches to wait for modal
-            modal_found = False
-            modal_selectors = [
-                ".modal",
-                "[class*='modal']",
-                "[class*='dialog']",
-                "[class*='form']",
-                "iframe",
-                "[role='dialog']",
-                "[data-testid*='modal']",
-            ]
-            
-            for selector in modal_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000, state="visible")
-                    logger.debug(f"Modal/dialog detected: {selector}")
-                    modal_found = True
-                    break
-                except:
-                    continue
+            # Wait for any modal selector at once (one timeout instead of one per selector);
+            # only presence matters here, so nothing is recorded as a winner
+            modal_found = await wait_for_any_visible(self.page, MESSAGE_MODAL, timeout=5)
             
             if not modal_found:
                 logger.warning("No explicit modal detected, but continuing anyway...")
@@ -416,21 +414,6 @@ class KleinanzeigenBot:
             
             # Fill message textarea - try many different selectors
             logger.info("🔍 Looking for message textarea...")
-            textarea_selectors = [
-                "textarea[placeholder*='Nachricht']",
-                "textarea[placeholder*='Ihre Nachricht']",
-                "textarea[placeholder*='Nachricht an']",
-                "textarea[name*='message']",
-                "textarea[id*='message']",
-                "textarea[class*='message']",
-                "textarea[data-testid*='message']",
-                "textarea[data-qa*='message']",
-                "iframe[src*='nachricht'] >> textarea",
-                "iframe >> textarea",
-                "textarea",
-                "div[contenteditable='true']",  # Sometimes it's a contenteditable div
-            ]
-            
             message_filled = False
             
             # First, try to find all iframes and check them
@@ -449,8 +432,8 @@ class KleinanzeigenBot:
                                 # Check if contenteditable
                                 is_contenteditable = await textarea.evaluate("el => el.contentEditable === 'true'")
                                 if is_contenteditable:
-                                    await textarea.evaluate(f"el => el.innerText = '{message}'")
-                                    await textarea.type(message, delay=50)
+                                    await textarea.evaluate("el => el.innerText = ''")
+                                    await textarea.type(message, delay=TYPING_DELAY_MS)
                                 else:
                                     await textarea.fill(message)
                                 logger.info(f"✅ Message filled in iframe #{i}")
@@ -464,7 +447,7 @@ class KleinanzeigenBot:
             
             # If not found in iframe, try direct selectors
             if not message_filled:
-                for selector in textarea_selectors:
+                for selector in prioritize_selectors(self.page, MESSAGE_TEXTAREA):
                     try:
                         logger.debug(f"Trying textarea selector: {selector}")
                         if "iframe" in selector:
@@ -477,11 +460,12 @@ class KleinanzeigenBot:
                             # Check if it's contenteditable div
                             is_contenteditable = await textarea.evaluate("el => el.contentEditable === 'true'")
                             if is_contenteditable or "contenteditable" in selector:
-                                await textarea.evaluate(f"el => el.innerText = ''")
-                                await textarea.type(message, delay=50)  # Type with delay
+                                await textarea.evaluate("el => el.innerText = ''")
+                                await type_in_browser(textarea, message)
                             else:
                                 await textarea.fill(message)
                             logger.info(f"✅ Message filled with selector: {selector}")
+                            remember_selector(self.page, MESSAGE_TEXTAREA, selector)
                             message_filled = True
                             break
                     except Exception as e:
@@ -490,7 +474,7 @@ class KleinanzeigenBot:
             
             if not message_filled:
                 logger.error("❌ Could not find message textarea")
-                await take_screenshot(self.page, prefix="message_textarea_error")
+                take_screenshot_in_background(self.page, prefix="message_textarea_error")
                 
                 # Debug: Try to find ANY textarea or contenteditable on page
                 try:
@@ -513,47 +497,42 @@ class KleinanzeigenBot:
                     logger.debug(f"Fallback textarea search failed: {e}")
                 
                 if not message_filled:
-                    # Debug: Find all textareas on page
-                    await debug_page_elements(self.page, "textarea_not_found")
-                    # Try to get page HTML for debugging
-                    try:
-                        content = await self.page.content()
-                        logger.debug(f"Page content length: {len(content)}")
-                        if "textarea" in content.lower() or "contenteditable" in content.lower():
-                            logger.warning("Page contains 'textarea' or 'contenteditable' but selector didn't match")
-                    except:
-                        pass
+                    # Debug: Find all textareas on page (slow DOM walk, debug mode only)
+                    if self.debug_mode:
+                        await debug_page_elements(self.page, "textarea_not_found")
+                        # Try to get page HTML for debugging
+                        try:
+                            content = await self.page.content()
+                            logger.debug(f"Page content length: {len(content)}")
+                            if "textarea" in content.lower() or "contenteditable" in content.lower():
+                                logger.warning("Page contains 'textarea' or 'contenteditable' but selector didn't match")
+                        except:
+                            pass
                     return False
             
             await random_delay(1, 2)
             
             # Click send button - try multiple selectors
             logger.info("🔍 Looking for send button...")
-            send_button_selectors = [
-                "button:has-text('Nachricht senden')",
-                "button:has-text('Senden')",
-                "button[type='submit']",
-                "button[class*='send']",
-                "[data-testid*='send']",
-                "[data-qa*='send']",
-                "button:has-text('Absenden')",
-            ]
-            
             send_clicked = False
-            for selector in send_button_selectors:
-                try:
-                    logger.debug(f"Trying send button selector: {selector}")
-                    button = await self.page.wait_for_selector(selector, timeout=5000, state="visible")
-                    if button:
-                        await button.scroll_into_view_if_needed()
+            
+            # Give any send button candidate a short window to appear; pages that
+            # submit on Enter have none, so don't wait a full timeout per selector
+            send_button_present = await wait_for_any_visible(self.page, MESSAGE_SEND, timeout=3)
+            if not send_button_present:
+                logger.debug("No send button candidate appeared")
+            
+            if send_button_present:
+                selector, button = await find_first_visible(self.page, MESSAGE_SEND)
+                if button:
+                    try:
                         await random_delay(0.5, 1.0)
                         await button.click()
                         logger.info(f"✅ Send button clicked with: {selector}")
+                        remember_selector(self.page, MESSAGE_SEND, selector)
                         send_clicked = True
-                        break
-                except Exception as e:
-                    logger.debug(f"Send button selector failed: {selector} - {e}")
-                    continue
+                    except Exception as e:
+                        logger.debug(f"Send button click failed: {selector} - {e}")
             
             if not send_clicked:
                 # Try pressing Enter as fallback
@@ -574,25 +553,19 @@ class KleinanzeigenBot:
             logger.info("⏳ Waiting for confirmation...")
             await random_delay(2, 3)
             
-            # Check for success indicators
-            try:
-                await wait_for_selector_with_fallbacks(
-                    self.page,
-                    SUCCESS_INDICATOR,
-                    timeout=5
-                )
+            # Check for success indicators (URL first, then all selectors in parallel)
+            if _URL_SUCCESS_RE.search(self.page.url) or await wait_success(self.page, timeout=2):
                 logger.info("✅ Message sent successfully")
-                return True
-            except:
+            else:
                 # Message might have been sent even without explicit confirmation
                 logger.info("✅ Message sent (assuming success)")
-                return True
+            return True
                 
         except Exception as e:
             logger.error(f"❌ Failed to send message: {e}")
-            await take_screenshot(self.page, prefix="send_message_error")
-            import traceback
-            logger.debug(traceback.format_exc())
+            await take_screenshot(self.page, prefix="send_message_error", full_page=True)
+            if is_level_enabled("DEBUG"):
+                logger.debug(traceback.format_exc())
             return False
     
     async def navigate_to_conversation(self) -> bool:
@@ -609,35 +582,33 @@ class KleinanzeigenBot:
         try:
             logger.info("📬 Navigating to conversations...")
             
-            # Navigate to messages page
+            # Navigate to messages page and wait for the conversation list itself
+            # instead of network idle plus a fixed delay
             await self.page.goto(
                 "https://www.kleinanzeigen.de/nachrichtenbox",
-                wait_until="networkidle",
+                wait_until="commit",
                 timeout=30000
             )
-            await random_delay(2, 3)
+            try:
+                await self.page.locator(LATEST_CONVERSATION_UNION).first.wait_for(
+                    state="attached", timeout=15000
+                )
+            except Exception as e:
+                logger.debug(f"Conversation list not attached yet: {e}")
             
             # Find and click latest conversation - try multiple selectors
             logger.info("🔍 Looking for latest conversation...")
-            conversation_selectors = [
-                ".qa-chat-item:first-child",
-                "[class*='conversation']:first-child",
-                "[class*='chat-item']:first-child",
-                "a[href*='/nachrichten/']:first-child",
-                "[data-testid*='conversation']:first-child",
-                "li:first-child a[href*='nachricht']",
-            ]
             
             conversation_clicked = False
-            for selector in conversation_selectors:
+            for selector in prioritize_selectors(self.page, LATEST_CONVERSATION):
                 try:
                     logger.debug(f"Trying conversation selector: {selector}")
                     element = await self.page.wait_for_selector(selector, timeout=5000, state="visible")
                     if element:
-                        await element.scroll_into_view_if_needed()
                         await random_delay(0.5, 1.0)
                         await element.click()
                         logger.info(f"✅ Conversation clicked with: {selector}")
+                        remember_selector(self.page, LATEST_CONVERSATION, selector)
                         conversation_clicked = True
                         break
                 except Exception as e:
@@ -657,7 +628,7 @@ class KleinanzeigenBot:
             
         except Exception as e:
             logger.error(f"❌ Failed to navigate to conversation: {e}")
-            await take_screenshot(self.page, prefix="navigate_conversation_error")
+            await take_screenshot(self.page, prefix="navigate_conversation_error", full_page=True)
             return False
     
     async def make_offer(
@@ -683,36 +654,47 @@ class KleinanzeigenBot:
             logger.error("Browser not initialized")
             return False
         
+        # Validate inputs before driving the browser
+        delivery_value = DELIVERY_OPTIONS.get(delivery)
+        if delivery_value is None:
+            logger.error(f"Invalid delivery option: {delivery}. Must be one of: {list(DELIVERY_OPTIONS)}")
+            return False
+        
+        if shipping_cost is not None and (
+            not isinstance(shipping_cost, (int, float)) or shipping_cost < 0
+        ):
+            logger.error(f"Invalid shipping cost: {shipping_cost}")
+            return False
+        
         try:
             logger.info(f"💰 Making offer: €{price}, delivery: {delivery}")
             
             # Find and click offer button - try multiple selectors
             logger.info("🔍 Looking for offer button...")
-            offer_button_selectors = [
-                "button:has-text('Angebot machen')",
-                "button:has-text('Angebot unterbreiten')",
-                "button:has-text('Angebot')",
-                "a:has-text('Angebot machen')",
-                "[data-testid*='offer']",
-                "[data-qa*='offer']",
-                "button[class*='offer']",
-            ]
-            
             offer_clicked = False
-            for selector in offer_button_selectors:
+            
+            # Fast path: role-based lookup by accessible name
+            button = await find_button(self.page, r"angebot (machen|unterbreiten)", timeout=5)
+            if button:
                 try:
-                    logger.debug(f"Trying offer button selector: {selector}")
-                    button = await self.page.wait_for_selector(selector, timeout=10000, state="visible")
-                    if button:
-                        await button.scroll_into_view_if_needed()
+                    await random_delay(0.5, 1.0)
+                    await button.click()
+                    logger.info("✅ Offer button clicked via role lookup")
+                    offer_clicked = True
+                except Exception as e:
+                    logger.debug(f"Role-based offer button click failed: {e}")
+            
+            if not offer_clicked and await wait_for_any_visible(self.page, OFFER_BUTTON, timeout=10):
+                selector, button = await find_first_visible(self.page, OFFER_BUTTON)
+                if button:
+                    try:
                         await random_delay(0.5, 1.0)
                         await button.click()
                         logger.info(f"✅ Offer button clicked with: {selector}")
+                        remember_selector(self.page, OFFER_BUTTON, selector)
                         offer_clicked = True
-                        break
-                except Exception as e:
-                    logger.debug(f"Offer button selector failed: {selector} - {e}")
-                    continue
+                    except Exception as e:
+                        logger.debug(f"Offer button click failed: {e}")
             
             if not offer_clicked:
                 logger.error("❌ Could not find offer button")
@@ -726,151 +708,50 @@ class KleinanzeigenBot:
             # Try to wait for modal container
             try:
                 await self.page.wait_for_selector(
-                    ".modal, [class*='modal'], [class*='dialog'], [class*='form']",
+                    OFFER_MODAL_UNION,
                     timeout=10000
                 )
                 logger.debug("Offer form/modal detected")
             except:
                 logger.debug("No explicit modal detected, continuing...")
             
-            # Fill price - try multiple selectors
-            logger.info(f"💰 Filling price: €{price}")
-            price_selectors = [
-                "input[name*='price']",
-                "input[placeholder*='EUR']",
-                "input[placeholder*='€']",
-                "input[type='number']",
-                "input[id*='price']",
-                "input[class*='price']",
-            ]
-            
-            price_filled = False
-            for selector in price_selectors:
-                try:
-                    logger.debug(f"Trying price selector: {selector}")
-                    input_field = await self.page.wait_for_selector(selector, timeout=5000, state="visible")
-                    if input_field:
-                        await input_field.scroll_into_view_if_needed()
-                        await random_delay(0.5, 1.0)
-                        await input_field.fill(str(price))
-                        logger.info(f"✅ Price filled with: {selector}")
-                        price_filled = True
-                        break
-                except Exception as e:
-                    logger.debug(f"Price selector failed: {selector} - {e}")
-                    continue
+            filled_fields: FrozenSet[str] = frozenset()
+            if self.fast_fill:
+                filled_fields = await self._fast_fill_offer_form(
+                    price,
+                    delivery_value,
+                    shipping_cost if delivery in ["shipping", "both"] else None,
+                    note,
+                )
+                if filled_fields:
+                    logger.info(f"✅ Offer form filled in a single step: {sorted(filled_fields)}")
             
-            if not price_filled:
-                logger.error("❌ Could not find price input")
-                await take_screenshot(self.page, prefix="offer_price_error")
+            # Fill whatever the fast path could not (everything if it is disabled)
+            if not await self._fill_offer_form(
+                price, delivery, delivery_value, shipping_cost, note, skip=filled_fields
+            ):
                 return False
             
             await random_delay(1, 2)
             
-            # Select delivery method
-            if delivery in DELIVERY_OPTIONS:
-                delivery_value = DELIVERY_OPTIONS[delivery]
-                logger.info(f"🚚 Selecting delivery: {delivery_value}")
-                
-                # Try dropdown select
-                delivery_selectors = [
-                    "select[name*='delivery']",
-                    "select[name*='shipping']",
-                    "select[id*='delivery']",
-                    "select",
-                ]
-                
-                delivery_selected = False
-                for selector in delivery_selectors:
-                    try:
-                        select_element = await self.page.wait_for_selector(selector, timeout=5000)
-                        if select_element:
-                            await select_element.select_option(value=delivery_value)
-                            logger.info(f"✅ Delivery selected via dropdown: {selector}")
-                            delivery_selected = True
-                            break
-                    except:
-                        continue
-                
-                if not delivery_selected:
-                    # Try clicking radio buttons or text
-                    logger.debug("Trying alternative delivery selection...")
-                    try:
-                        delivery_text = delivery_value.lower()
-                        await self.page.click(f"text=/{delivery_text}/i", timeout=5000)
-                        logger.info("✅ Delivery selected via text click")
-                    except:
-                        logger.warning("⚠️ Could not select delivery method")
-            
-            await random_delay(1, 2)
-            
-            # Fill shipping cost if applicable
-            if shipping_cost and delivery in ["shipping", "both"]:
-                logger.info(f"📦 Filling shipping cost: €{shipping_cost}")
-                shipping_selectors = [
-                    "input[name*='shipping']",
-                    "input[placeholder*='Versand']",
-                    "input[id*='shipping']",
-                ]
-                
-                for selector in shipping_selectors:
-                    try:
-                        shipping_input = await self.page.wait_for_selector(selector, timeout=3000)
-                        if shipping_input:
-                            await shipping_input.fill(str(shipping_cost))
-                            logger.info("✅ Shipping cost filled")
-                            break
-                    except:
-                        continue
-            
-            # Fill note if provided
-            if note:
-                logger.info("📝 Filling offer note...")
-                note_selectors = [
-                    "textarea[name*='note']",
-                    "textarea[placeholder*='Nachricht']",
-                    "textarea[id*='note']",
-                    "textarea",
-                ]
-                
-                for selector in note_selectors:
-                    try:
-                        note_textarea = await self.page.wait_for_selector(selector, timeout=3000)
-                        if note_textarea:
-                            await note_textarea.fill(note)
-                            logger.info("✅ Note filled")
-                            break
-                    except:
-                        continue
-            
-            await random_delay(1, 2)
-            
             # Submit offer - try multiple selectors
             logger.info("🔍 Looking for submit button...")
-            submit_selectors = [
-                "button:has-text('Angebot senden')",
-                "button:has-text('Angebot unterbreiten')",
-                "button:has-text('Senden')",
-                "button[type='submit']",
-                "[data-testid*='submit']",
-                "button:has-text('Absenden')",
-            ]
-            
             submit_clicked = False
-            for selector in submit_selectors:
+            # Ordered pick: "Senden" and button[type='submit'] also match other forms
+            # on the page, so the specific "Angebot senden" names must win
+            if await wait_for_any_visible(self.page, OFFER_SUBMIT, timeout=5):
+                selector, button = await find_first_visible(self.page, OFFER_SUBMIT)
+            else:
+                selector, button = None, None
+            if button:
                 try:
-                    logger.debug(f"Trying submit selector: {selector}")
-                    button = await self.page.wait_for_selector(selector, timeout=5000, state="visible")
-                    if button:
-                        await button.scroll_into_view_if_needed()
-                        await random_delay(0.5, 1.0)
-                        await button.click()
-                        logger.info(f"✅ Submit button clicked with: {selector}")
-                        submit_clicked = True
-                        break
+                    await random_delay(0.5, 1.0)
+                    await button.click()
+                    logger.info(f"✅ Submit button clicked with: {selector}")
+                    remember_selector(self.page, OFFER_SUBMIT, selector)
+                    submit_clicked = True
                 except Exception as e:
-                    logger.debug(f"Submit selector failed: {selector} - {e}")
-                    continue
+                    logger.debug(f"Submit button click failed: {e}")
             
             if not submit_clicked:
                 # Try Enter key as fallback
@@ -892,24 +773,234 @@ class KleinanzeigenBot:
             await random_delay(3, 5)
             
             # Check for success
-            try:
-                await wait_for_selector_with_fallbacks(
-                    self.page,
-                    SUCCESS_INDICATOR,
-                    timeout=5
-                )
+            if await wait_success(self.page, timeout=2):
                 logger.info(f"✅ Offer sent: €{price}, {delivery}")
-                return True
-            except:
+            else:
                 logger.info("✅ Offer sent (assuming success)")
-                return True
+            return True
                 
         except Exception as e:
             logger.error(f"❌ Failed to make offer: {e}")
-            await take_screenshot(self.page, prefix="make_offer_error")
-            import traceback
-            logger.debug(traceback.format_exc())
+            await take_screenshot(self.page, prefix="make_offer_error", full_page=True)
+            if is_level_enabled("DEBUG"):
+                logger.debug(traceback.format_exc())
+            return False
+    
+    async def _fill_offer_form(
+        self,
+        price: float,
+        delivery: str,
+        delivery_value: str,
+        shipping_cost: Optional[float],
+        note: Optional[str],
+        skip: FrozenSet[str] = frozenset()
+    ) -> bool:
+        """
+        Fill the offer form field by field with human-like pauses.
+        
+        Args:
+            price: Offer price in EUR
+            delivery: Delivery method key ("pickup", "shipping", or "both")
+            delivery_value: Site value for the delivery method
+            shipping_cost: Shipping cost if applicable
+            note: Additional note for the offer
+            skip: Fields already filled ("price", "delivery", "shipping", "note")
+            
+        Returns:
+            True if at least the price was filled, False otherwise
+        """
+        if "price" not in skip:
+            if not await self._fill_offer_price(price):
+                return False
+            await random_delay(1, 2)
+        
+        if "delivery" not in skip:
+            await self._select_offer_delivery(delivery_value)
+            await random_delay(1, 2)
+        
+        # Fill shipping cost if applicable
+        if shipping_cost and delivery in ["shipping", "both"] and "shipping" not in skip:
+            logger.info(f"📦 Filling shipping cost: €{shipping_cost}")
+            for selector in prioritize_selectors(self.page, OFFER_SHIPPING_INPUT):
+                try:
+                    shipping_input = await self.page.wait_for_selector(selector, timeout=3000)
+                    if shipping_input:
+                        await shipping_input.fill(str(shipping_cost))
+                        logger.info("✅ Shipping cost filled")
+                        remember_selector(self.page, OFFER_SHIPPING_INPUT, selector)
+                        break
+                except:
+                    continue
+        
+        # Fill note if provided
+        if note and "note" not in skip:
+            logger.info("📝 Filling offer note...")
+            for selector in prioritize_selectors(self.page, OFFER_NOTE_TEXTAREA):
+                try:
+                    note_textarea = await self.page.wait_for_selector(selector, timeout=3000)
+                    if note_textarea:
+                        await note_textarea.fill(note)
+                        logger.info("✅ Note filled")
+                        remember_selector(self.page, OFFER_NOTE_TEXTAREA, selector)
+                        break
+                except:
+                    continue
+        
+        return True
+    
+    async def _fill_offer_price(self, price: float) -> bool:
+        """
+        Fill the offer price input.
+        
+        Args:
+            price: Offer price in EUR
+            
+        Returns:
+            True if the price was filled, False otherwise
+        """
+        # Fill price - try multiple selectors
+        logger.info(f"💰 Filling price: €{price}")
+        price_filled = False
+        for selector in prioritize_selectors(self.page, OFFER_PRICE_INPUT):
+            try:
+                logger.debug(f"Trying price selector: {selector}")
+                input_field = await self.page.wait_for_selector(selector, timeout=5000, state="visible")
+                if input_field:
+                    await random_delay(0.5, 1.0)
+                    await input_field.fill(str(price))
+                    logger.info(f"✅ Price filled with: {selector}")
+                    remember_selector(self.page, OFFER_PRICE_INPUT, selector)
+                    price_filled = True
+                    break
+            except Exception as e:
+                logger.debug(f"Price selector failed: {selector} - {e}")
+                continue
+        
+        if not price_filled:
+            logger.error("❌ Could not find price input")
+            await take_screenshot(self.page, prefix="offer_price_error")
             return False
+        
+        return True
+    
+    async def _select_offer_delivery(self, delivery_value: str) -> bool:
+        """
+        Select the delivery method, via dropdown or by clicking its label text.
+        
+        Args:
+            delivery_value: Site value for the delivery method
+            
+        Returns:
+            True if the delivery method was selected, False otherwise
+        """
+        # Select delivery method
+        logger.info(f"🚚 Selecting delivery: {delivery_value}")
+        
+        # Try dropdown select
+        delivery_selected = False
+        for selector in prioritize_selectors(self.page, OFFER_DELIVERY_SELECT):
+            try:
+                select_element = await self.page.wait_for_selector(selector, timeout=5000)
+                if select_element:
+                    await select_element.select_option(value=delivery_value)
+                    logger.info(f"✅ Delivery selected via dropdown: {selector}")
+                    remember_selector(self.page, OFFER_DELIVERY_SELECT, selector)
+                    delivery_selected = True
+                    break
+            except:
+                continue
+        
+        if not delivery_selected:
+            # Try clicking radio buttons or text
+            logger.debug("Trying alternative delivery selection...")
+            try:
+                delivery_text = delivery_value.lower()
+                await self.page.click(f"text=/{delivery_text}/i", timeout=5000)
+                logger.info("✅ Delivery selected via text click")
+                delivery_selected = True
+            except:
+                logger.warning("⚠️ Could not select delivery method")
+        
+        return delivery_selected
+    
+    async def _fast_fill_offer_form(
+        self,
+        price: float,
+        delivery_value: str,
+        shipping_cost: Optional[float],
+        note: Optional[str]
+    ) -> FrozenSet[str]:
+        """
+        Fill all offer form fields with a single script call.
+        
+        Sets values through the native value setters and dispatches input/change
+        events so framework-managed inputs pick them up. Much faster than filling
+        field by field, but not human-like. Only visible fields are used, and a
+        field only counts as filled if it kept the value (a select silently
+        rejects values none of its options have).
+        
+        Args:
+            price: Offer price in EUR
+            delivery_value: Site value for the delivery method
+            shipping_cost: Shipping cost, or None to leave the field untouched
+            note: Additional note, or None to leave the field untouched
+            
+        Returns:
+            Names of the fields that were filled ("price", "delivery", "shipping", "note")
+        """
+        try:
+            filled = await self.page.evaluate(
+                """(args) => {
+                    const visible = (el) => {
+                        const style = getComputedStyle(el);
+                        return el.getClientRects().length > 0
+                            && style.visibility !== 'hidden'
+                            && style.display !== 'none';
+                    };
+                    const set = (selectors, value) => {
+                        if (value === null) return false;
+                        for (const sel of selectors) {
+                            for (const el of document.querySelectorAll(sel)) {
+                                if (!visible(el)) continue;
+                                const setter = Object.getOwnPropertyDescriptor(
+                                    Object.getPrototypeOf(el), 'value'
+                                ).set;
+                                const previous = el.value;
+                                setter.call(el, value);
+                                if (el.value !== value) {
+                                    // Rejected (e.g. no such <option>): undo the blanking
+                                    setter.call(el, previous);
+                                    continue;
+                                }
+                                el.dispatchEvent(new Event('input', {bubbles: true}));
+                                el.dispatchEvent(new Event('change', {bubbles: true}));
+                                return true;
+                            }
+                        }
+                        return false;
+                    };
+                    return {
+                        price: set(args.price[0], args.price[1]),
+                        delivery: set(args.delivery[0], args.delivery[1]),
+                        shipping: set(args.shipping[0], args.shipping[1]),
+                        note: set(args.note[0], args.note[1]),
+                    };
+                }""",
+                {
+                    "price": [list(OFFER_PRICE_INPUT), str(price)],
+                    "delivery": [list(OFFER_DELIVERY_SELECT), delivery_value],
+                    "shipping": [
+                        list(OFFER_SHIPPING_INPUT),
+                        str(shipping_cost) if shipping_cost else None,
+                    ],
+                    "note": [list(OFFER_NOTE_TEXTAREA), note],
+                },
+            )
+            logger.debug(f"Fast form fill result: {filled}")
+            return frozenset(field for field, ok in filled.items() if ok)
+        except Exception as e:
+            logger.debug(f"Fast form fill failed, falling back to field-by-field: {e}")
+            return frozenset()
     
     async def execute_full_workflow(
         self,
@@ -998,7 +1089,7 @@ class KleinanzeigenBot:
         except Exception as e:
             logger.error(f"Workflow error: {e}")
             if self.page:
-                await take_screenshot(self.page, prefix="workflow_error")
+                await take_screenshot(self.page, prefix="workflow_error", full_page=True)
         
         finally:
             await self.close()
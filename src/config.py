@@ -14,6 +14,10 @@ TIMEOUTS: Dict[str, int] = {
     "success_confirmation": 3,
 }
 
+# Per-character delay (ms) when typing into the message field.
+# Other form fields (offer note, shipping cost) are filled in one step.
+TYPING_DELAY_MS: int = 50
+
 # Delivery method options mapping
 DELIVERY_OPTIONS: Dict[str, str] = {
     "pickup": "Abholung",
@@ -31,6 +35,7 @@ COOKIES_PATH: str = "./cookies.json"
 LOGS_DIR: str = "./logs"
 SCREENSHOTS_DIR: str = "./screenshots"
 LOG_FILE: str = "./logs/bot.log"
+SELECTOR_STATS_PATH: str = "./.selector_stats.json"
 
 # Browser settings
 BROWSER_ARGS: list = [
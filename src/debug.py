@@ -19,49 +19,60 @@ async def find_all_buttons_with_text(page: Page, search_text: str) -> list:
     """
     results = []
     try:
-        # Find all buttons and links
-        elements = await page.query_selector_all("button, a")
+        # Collect all buttons and links in a single browser round-trip
+        elements = await page.eval_on_selector_all(
+            "button, a",
+            """els => els.map(el => ({
+                text: el.textContent || '',
+                tag: el.tagName,
+                id: el.id || '',
+                class: el.getAttribute('class') || '',
+                href: el.getAttribute('href') || '',
+                'data-testid': el.getAttribute('data-testid') || '',
+                'data-qa': el.getAttribute('data-qa') || '',
+                is_visible: !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length),
+            }))""",
+        )
         
         for element in elements:
-            try:
-                text = await element.text_content()
-                if text and search_text.lower() in text.lower():
-                    tag = await element.evaluate("el => el.tagName")
-                    classes = await element.get_attribute("class") or ""
-                    element_id = await element.get_attribute("id") or ""
-                    href = await element.get_attribute("href") or ""
-                    data_testid = await element.get_attribute("data-testid") or ""
-                    data_qa = await element.get_attribute("data-qa") or ""
-                    
-                    # Generate possible selectors
-                    selectors = []
-                    if element_id:
-                        selectors.append(f"#{element_id}")
-                    if classes:
-                        for cls in classes.split():
-                            if cls:
-                                selectors.append(f".{cls}")
-                    if data_testid:
-                        selectors.append(f"[data-testid='{data_testid}']")
-                    if data_qa:
-                        selectors.append(f"[data-qa='{data_qa}']")
-                    if href:
-                        selectors.append(f"a[href='{href}']")
-                    selectors.append(f"{tag.lower()}:has-text('{text.strip()}')")
-                    
-                    results.append({
-                        "text": text.strip(),
-                        "tag": tag,
-                        "id": element_id,
-                        "class": classes,
-                        "href": href,
-                        "data-testid": data_testid,
-                        "data-qa": data_qa,
-                        "selectors": selectors,
-                        "is_visible": await element.is_visible(),
-                    })
-            except:
+            text = element["text"]
+            if not text or search_text.lower() not in text.lower():
                 continue
+            
+            tag = element["tag"]
+            classes = element["class"]
+            element_id = element["id"]
+            href = element["href"]
+            data_testid = element["data-testid"]
+            data_qa = element["data-qa"]
+            
+            # Generate possible selectors
+            selectors = []
+            if element_id:
+                selectors.append(f"#{element_id}")
+            if classes:
+                for cls in classes.split():
+                    if cls:
+                        selectors.append(f".{cls}")
+            if data_testid:
+                selectors.append(f"[data-testid='{data_testid}']")
+            if data_qa:
+                selectors.append(f"[data-qa='{data_qa}']")
+            if href:
+                selectors.append(f"a[href='{href}']")
+            selectors.append(f"{tag.lower()}:has-text('{text.strip()}')")
+            
+            results.append({
+                "text": text.strip(),
+                "tag": tag,
+                "id": element_id,
+                "class": classes,
+                "href": href,
+                "data-testid": data_testid,
+                "data-qa": data_qa,
+                "selectors": selectors,
+                "is_visible": element["is_visible"],
+            })
         
         return results
     except Exception as e:
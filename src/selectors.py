@@ -3,49 +3,106 @@ Centralized CSS/XPath selectors for eBay Kleinanzeigen elements.
 Easy to update if the website changes its HTML structure.
 """
 
+import re
+from functools import lru_cache
+from typing import Tuple
+
+
+def is_plain_css(selector: str) -> bool:
+    """
+    Check whether a selector is plain CSS (no Playwright-only syntax).
+    
+    Args:
+        selector: Selector string
+        
+    Returns:
+        False for :has-text(), >> chains, text= and role= selectors, True otherwise
+    """
+    return (
+        ":has-text(" not in selector
+        and ">>" not in selector
+        and not selector.startswith(("text=", "role="))
+    )
+
+
+def role_selector(role: str, name: str) -> str:
+    """
+    Build a Playwright role selector matched against the accessible name.
+    The name match is a case-insensitive substring match.
+    
+    Args:
+        role: ARIA role (e.g. "button", "link")
+        name: Accessible name to match
+        
+    Returns:
+        Selector string usable wherever a CSS selector is accepted
+    """
+    return f'role={role}[name="{name}"]'
+
+
+@lru_cache(maxsize=None)
+def css_union(selectors: Tuple[str, ...]) -> str:
+    """
+    Join the plain-CSS selectors of a group into one comma-separated selector.
+    
+    Args:
+        selectors: Tuple of selector strings
+        
+    Returns:
+        Comma-separated selector list (empty if no plain-CSS selectors)
+    """
+    return ", ".join(s for s in selectors if is_plain_css(s))
+
+
 # Cookie banner selectors
-COOKIE_BANNER: list = [
-    "button:has-text('Alle akzeptieren')",
-    "button:has-text('Akzeptieren')",
+COOKIE_BANNER: tuple = (
+    role_selector("button", "Alle akzeptieren"),
+    role_selector("button", "Akzeptieren"),
     "button[id*='accept']",
     "button[class*='accept']",
-]
+    # :has-text() fallbacks
+    "button:has-text('Alle akzeptieren')",
+    "button:has-text('Akzeptieren')",
+)
 
 # Login selectors
-LOGIN_LINK: list = [
-    "a:has-text('Anmelden')",
+LOGIN_LINK: tuple = (
+    role_selector("link", "Anmelden"),
+    role_selector("button", "Anmelden"),
     "a[href*='login']",
     "a[href*='einloggen']",
-    "button:has-text('Anmelden')",
     "a[data-gaaction='login']",
     "[class*='login']",
     "[class*='anmelden']",
     "a[title*='Anmelden']",
     "a[title*='Login']",
-]
+    # :has-text() fallbacks
+    "a:has-text('Anmelden')",
+    "button:has-text('Anmelden')",
+)
 
-EMAIL_FIELD: list = [
+EMAIL_FIELD: tuple = (
     "input[name='email']",
     "input[type='email']",
     "input[id*='email']",
     "input[placeholder*='E-Mail']",
-]
+)
 
-PASSWORD_FIELD: list = [
+PASSWORD_FIELD: tuple = (
     "input[name='password']",
     "input[type='password']",
     "input[id*='password']",
-]
+)
 
-LOGIN_SUBMIT: list = [
+LOGIN_SUBMIT: tuple = (
     "button#login-submit",  # Exact ID from website: <button id="login-submit">
     "#login-submit",  # Shorthand
     "button[id='login-submit']",  # Alternative syntax
     "button.button[type='submit']",  # Class + type
     "button[type='submit']:has(span:has-text('Einloggen'))",  # Text in span
-    "button:has-text('Einloggen')",  # Text-based fallback
+    role_selector("button", "Einloggen"),  # Text-based fallback
+    role_selector("button", "Anmelden"),  # Alternative text
     "button[type='submit']",  # Generic submit button
-    "button:has-text('Anmelden')",  # Alternative text
     "button[class*='submit']",
     "button[class*='login']",
     "button[id*='submit']",
@@ -53,113 +110,150 @@ LOGIN_SUBMIT: list = [
     "input[type='submit']",
     "[data-testid*='login-submit']",
     "[data-qa*='login-submit']",
-]
+    # :has-text() fallbacks
+    "button:has-text('Einloggen')",  # Text-based fallback
+    "button:has-text('Anmelden')",  # Alternative text
+)
 
 # Message sending selectors
-MESSAGE_BUTTON: list = [
-    "button:has-text('Nachricht schreiben')",
-    "button:has-text('Nachricht senden')",
-    "a:has-text('Nachricht schreiben')",
-    "button[class*='message']",
+# Buttons/links named "Nachricht schreiben/senden" or "Kontakt…" are found by
+# find_button() before this group is tried, so only other shapes are listed
+MESSAGE_BUTTON: tuple = (
     "a[href*='nachricht']",
-]
+    "button[class*='contact']",
+    "button[class*='message']",
+    "a[class*='contact']",
+    "a[class*='message']",
+    "[data-testid*='contact']",
+    "[data-qa*='contact']",
+    "[data-gaaction*='contact']",
+    "button[id*='contact']",
+    "a[id*='contact']",
+    # :has-text() fallbacks for anchors without href (no link role)
+    "a:has-text('Nachricht schreiben')",
+    "a:has-text('Nachricht senden')",
+)
 
-MESSAGE_MODAL: list = [
-    ".modal-content",
-    ".qa-chat-form",
+# No "iframe" or "[class*='form']" here: ad iframes and the search form are
+# already on the page before the message dialog opens
+MESSAGE_MODAL: tuple = (
+    "[role='dialog']",
+    ".modal",
+    "[data-testid*='modal']",
     "[class*='modal']",
-    "[class*='message-form']",
-]
+    "[class*='dialog']",
+)
 
-MESSAGE_TEXTAREA: list = [
-    "textarea[placeholder*='Nachricht']",
-    "textarea[placeholder*='Ihre Nachricht']",
-    "textarea[placeholder*='Nachricht an']",
+MESSAGE_TEXTAREA: tuple = (
+    "textarea[placeholder*='Nachricht']",  # Also covers "Ihre Nachricht", "Nachricht an"
     "textarea[name*='message']",
     "textarea[id*='message']",
     "textarea[class*='message']",
     "textarea[data-testid*='message']",
     "textarea[data-qa*='message']",
+    "iframe[src*='nachricht'] >> textarea",
     "iframe >> textarea",
-    "div[contenteditable='true']",
     "textarea",
-]
+    "div[contenteditable='true']",  # Sometimes it's a contenteditable div
+)
 
-MESSAGE_SEND: list = [
-    "button:has-text('Nachricht senden')",
-    "button:has-text('Senden')",
+MESSAGE_SEND: tuple = (
+    role_selector("button", "Nachricht senden"),
+    role_selector("button", "Senden"),
+    role_selector("button", "Absenden"),
     "button[type='submit']",
     "button[class*='send']",
-]
+    "[data-testid*='send']",
+    "[data-qa*='send']",
+)
 
 # Conversation navigation selectors
-CONVERSATIONS_PAGE: list = [
+CONVERSATIONS_PAGE: tuple = (
     "a[href*='/nachrichtenbox']",
-    "a:has-text('Nachrichten')",
+    role_selector("link", "Nachrichten"),
     "a[href*='messages']",
-]
+    # :has-text() fallbacks
+    "a:has-text('Nachrichten')",
+)
 
-LATEST_CONVERSATION: list = [
+LATEST_CONVERSATION: tuple = (
     ".qa-chat-item:first-child",
     "[class*='conversation']:first-child",
     "[class*='chat-item']:first-child",
     "a[href*='/nachrichten/']:first-child",
-]
+    "[data-testid*='conversation']:first-child",
+    "li:first-child a[href*='nachricht']",
+)
 
 # Offer making selectors
-OFFER_BUTTON: list = [
-    "button:has-text('Angebot machen')",
-    "button:has-text('Angebot unterbreiten')",
-    "button:has-text('Angebot')",
+# "Angebot machen/unterbreiten" buttons and links are found by find_button()
+OFFER_BUTTON: tuple = (
+    role_selector("button", "Angebot"),
+    "[data-testid*='offer']",
+    "[data-qa*='offer']",
+    "button[class*='offer']",
+    # :has-text() fallback for anchors without href (no link role)
     "a:has-text('Angebot machen')",
-]
+)
 
-OFFER_MODAL: list = [
-    ".modal-content",
-    "[class*='offer']",
+OFFER_MODAL: tuple = (
+    ".modal",
     "[class*='modal']",
+    "[class*='dialog']",
     "[class*='form']",
-]
+)
 
-OFFER_PRICE_INPUT: list = [
+OFFER_PRICE_INPUT: tuple = (
     "input[name*='price']",
     "input[placeholder*='EUR']",
+    "input[placeholder*='€']",
     "input[type='number']",
     "input[id*='price']",
-]
+    "input[class*='price']",
+)
 
-OFFER_DELIVERY_SELECT: list = [
+OFFER_DELIVERY_SELECT: tuple = (
     "select[name*='delivery']",
     "select[name*='shipping']",
     "select[id*='delivery']",
     "select",
-]
+)
 
-OFFER_SHIPPING_INPUT: list = [
+OFFER_SHIPPING_INPUT: tuple = (
     "input[name*='shipping']",
     "input[placeholder*='Versand']",
     "input[id*='shipping']",
-]
+)
 
-OFFER_NOTE_TEXTAREA: list = [
+OFFER_NOTE_TEXTAREA: tuple = (
     "textarea[name*='note']",
     "textarea[placeholder*='Nachricht']",
     "textarea[id*='note']",
     "textarea",
-]
+)
 
-OFFER_SUBMIT: list = [
-    "button:has-text('Angebot senden')",
-    "button:has-text('Angebot unterbreiten')",
-    "button:has-text('Senden')",
+OFFER_SUBMIT: tuple = (
+    role_selector("button", "Angebot senden"),
+    role_selector("button", "Angebot unterbreiten"),
+    role_selector("button", "Senden"),
+    role_selector("button", "Absenden"),
     "button[type='submit']",
-]
+    "[data-testid*='submit']",
+)
 
 # Success indicators
-SUCCESS_INDICATOR: list = [
+SUCCESS_INDICATOR: tuple = (
     "text=/Angebot.*versendet/",
     "text=/erfolgreich/",
     "text=/versendet/",
     "[class*='success']",
-]
+)
+
+# One compiled pattern covering every text= entry of SUCCESS_INDICATOR
+SUCCESS_INDICATOR_RE = re.compile(r"erfolgreich|versendet", re.I)
 
+# Precomputed single-selector unions for groups that are waited on as a whole
+MESSAGE_BUTTON_UNION: str = css_union(MESSAGE_BUTTON)
+LATEST_CONVERSATION_UNION: str = css_union(LATEST_CONVERSATION)
+OFFER_MODAL_UNION: str = css_union(OFFER_MODAL)
+SUCCESS_INDICATOR_UNION: str = css_union(SUCCESS_INDICATOR)
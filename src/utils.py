@@ -3,17 +3,150 @@ Utility functions for logging, screenshots, retries, and helpers.
 """
 
 import os
+import json
+import hashlib
+import sys
+import re
+import inspect
 import time
 import random
 import asyncio
-from datetime import datetime
+import itertools
+import weakref
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict, Sequence, Set, Tuple
+from urllib.parse import urlparse
 
 from loguru import logger
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
-from src.config import LOGS_DIR, SCREENSHOTS_DIR, LOG_FILE, MAX_RETRIES, RETRY_BACKOFF
+from src.config import (
+    LOGS_DIR,
+    SCREENSHOTS_DIR,
+    LOG_FILE,
+    SELECTOR_STATS_PATH,
+    MAX_RETRIES,
+    RETRY_BACKOFF,
+    TYPING_DELAY_MS,
+)
+from src.selectors import (
+    SUCCESS_INDICATOR_RE,
+    SUCCESS_INDICATOR_UNION,
+    css_union,
+    is_plain_css,
+)
+
+
+# Winning selector per (host, selector group), shared by every caller on the same site
+_winning_selectors: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+
+
+@lru_cache(maxsize=None)
+def _group_key(selectors: Tuple[str, ...]) -> str:
+    """
+    Stable key for a selector group, used to persist its hit counts.
+    
+    Args:
+        selectors: Selector group
+        
+    Returns:
+        Short hex digest of the group's selectors (changes when the group does)
+    """
+    return hashlib.sha1("\n".join(selectors).encode()).hexdigest()[:12]
+
+
+def _load_selector_stats() -> Dict[str, Counter]:
+    """Load per-group selector hit counts persisted by earlier runs."""
+    try:
+        with open(SELECTOR_STATS_PATH, "r") as f:
+            data = json.load(f)
+        return defaultdict(Counter, {group: Counter(hits) for group, hits in data.items()})
+    except Exception:
+        return defaultdict(Counter)
+
+
+# How often each selector matched within its group, across runs (see save_selector_stats).
+# Counts are per group: the same generic selector (e.g. "textarea") may be a
+# good match in one group and the wrong element in another.
+_selector_hits: Dict[str, Counter] = _load_selector_stats()
+
+# Output directories as Path objects, built once at import
+_LOGS_PATH = Path(LOGS_DIR)
+_SCREENSHOTS_PATH = Path(SCREENSHOTS_DIR)
+
+# Suffix for screenshot names so captures within the same second don't collide
+_screenshot_seq = itertools.count()
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks: Set[asyncio.Task] = set()
+
+# Pages on which the cookie banner is dismissed by a locator handler
+_banner_handled_pages: "weakref.WeakSet[Page]" = weakref.WeakSet()
+_COOKIE_ACCEPT_RE = re.compile(r"^(Alle )?akzeptieren$", re.I)
+
+
+def prioritize_selectors(page: Page, selectors: Sequence[str]) -> Tuple[str, ...]:
+    """
+    Order selectors so the one that last matched on this site is tried first,
+    followed by the rest sorted by how often they matched in earlier runs.
+    
+    Args:
+        page: Playwright page object
+        selectors: Sequence of selector strings
+        
+    Returns:
+        Tuple of selectors with the cached winner (if any) moved to the front
+    """
+    selectors = tuple(selectors)
+    winner = _winning_selectors.get((urlparse(page.url).netloc, selectors))
+    hits = _selector_hits.get(_group_key(selectors))
+    # sorted() is stable, so selectors without hits keep their declared order
+    ordered = tuple(sorted(selectors, key=lambda s: hits[s], reverse=True)) if hits else selectors
+    if winner is None:
+        return ordered
+    return (winner,) + tuple(s for s in ordered if s != winner)
+
+
+def remember_selector(page: Page, selectors: Sequence[str], selector: str) -> None:
+    """
+    Record the selector that was used so later lookups on this site try it first.
+    Call it only after the element was actually clicked or filled.
+    
+    Args:
+        page: Playwright page object
+        selectors: Selector group the match belongs to
+        selector: Selector that matched
+    """
+    if selector not in selectors:
+        return
+    _winning_selectors[(urlparse(page.url).netloc, tuple(selectors))] = selector
+    _selector_hits[_group_key(tuple(selectors))][selector] += 1
+
+
+def save_selector_stats() -> None:
+    """Persist per-group selector hit counts so the next run tries common winners first."""
+    if not _selector_hits:
+        return
+    try:
+        with open(SELECTOR_STATS_PATH, "w") as f:
+            json.dump(_selector_hits, f, indent=2)
+    except Exception as e:
+        logger.debug(f"Could not save selector stats: {e}")
+
+
+def is_level_enabled(level: str) -> bool:
+    """
+    Check whether any configured log handler accepts records of the given level.
+    
+    Args:
+        level: Loguru level name (e.g. "DEBUG", "INFO")
+        
+    Returns:
+        True if a record of this level would be emitted, False otherwise
+    """
+    return logger.level(level).no >= logger._core.min_level
 
 
 async def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
@@ -30,10 +163,24 @@ async def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> No
     # Add occasional longer pauses (human behavior)
     if random.random() < 0.1:  # 10% chance
         delay += random.uniform(2, 5)
-    logger.debug(f"⏳ Random delay: {delay:.2f}s")
+    logger.debug("⏳ Random delay: {:.2f}s", delay)
     await asyncio.sleep(delay)
 
 
+@lru_cache(maxsize=1)
+def _ensure_logs_dir() -> Path:
+    """Create the logs directory once per process and return it."""
+    _LOGS_PATH.mkdir(parents=True, exist_ok=True)
+    return _LOGS_PATH
+
+
+@lru_cache(maxsize=1)
+def _ensure_screenshots_dir() -> Path:
+    """Create the screenshots directory once per process and return it."""
+    _SCREENSHOTS_PATH.mkdir(parents=True, exist_ok=True)
+    return _SCREENSHOTS_PATH
+
+
 def setup_logging(debug: bool = False) -> None:
     """
     Configure loguru logger with file and console output.
@@ -42,7 +189,7 @@ def setup_logging(debug: bool = False) -> None:
         debug: If True, set log level to DEBUG, otherwise INFO
     """
     # Create logs directory if it doesn't exist
-    Path(LOGS_DIR).mkdir(parents=True, exist_ok=True)
+    _ensure_logs_dir()
     
     # Remove default handler
     logger.remove()
@@ -50,10 +197,11 @@ def setup_logging(debug: bool = False) -> None:
     # Add console handler
     log_level = "DEBUG" if debug else "INFO"
     logger.add(
-        lambda msg: print(msg, end=""),
+        sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> | <level>{message}</level>",
         level=log_level,
-        colorize=True,
+        colorize=sys.stderr.isatty(),
+        enqueue=True,
     )
     
     # Add file handler
@@ -63,16 +211,59 @@ def setup_logging(debug: bool = False) -> None:
         level=log_level,
         rotation="10 MB",
         retention="7 days",
-        compression="zip",
+        compression="gz",
+        enqueue=True,  # write, rotate and compress on loguru's worker thread
     )
     
     logger.info("Logging initialized")
 
 
+class _NoStackInspect:
+    """Stand-in for the inspect module that skips call stack capture."""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(inspect, name)
+    
+    @staticmethod
+    def stack(context: int = 1) -> list:
+        return []
+
+
+def patch_playwright() -> bool:
+    """
+    Stop Playwright from capturing the Python call stack on every API call.
+    
+    Playwright calls inspect.stack() for each API call to attach the caller's
+    location to traces and error messages, which is expensive in selector-heavy
+    flows. Opt-in via PW_INSPECT_STACK=0: it relies on a private Playwright
+    module, and without the stack Playwright cannot name the API call, so
+    error messages lose their "Locator.wait_for: " style prefix.
+    
+    Returns:
+        True if Playwright was patched, False otherwise
+    """
+    if os.getenv("PW_INSPECT_STACK") != "0":
+        return False
+    
+    try:
+        from playwright._impl import _connection
+    except ImportError as e:
+        logger.debug(f"Could not patch Playwright stack capture: {e}")
+        return False
+    
+    _connection.inspect = _NoStackInspect()
+    logger.debug("Playwright call stack capture disabled")
+    return True
+
+
 async def take_screenshot(
     page: Page,
     filename: Optional[str] = None,
-    prefix: str = "error"
+    prefix: str = "error",
+    *,
+    full_page: bool = False,
+    fmt: str = "jpeg",
+    quality: int = 60
 ) -> str:
     """
     Take a screenshot and save it to screenshots directory.
@@ -81,65 +272,463 @@ async def take_screenshot(
         page: Playwright page object
         filename: Optional custom filename, otherwise auto-generated
         prefix: Prefix for auto-generated filename
+        full_page: Capture the whole scrollable page instead of the viewport
+        fmt: Image format, "jpeg" or "png"
+        quality: JPEG quality (ignored for PNG)
         
     Returns:
         Path to saved screenshot
     """
-    Path(SCREENSHOTS_DIR).mkdir(parents=True, exist_ok=True)
+    screenshots_dir = _ensure_screenshots_dir()
     
     if not filename:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{prefix}_{timestamp}.png"
+        timestamp = f"{time.strftime('%Y%m%d_%H%M%S')}_{next(_screenshot_seq)}"
+        extension = "jpg" if fmt == "jpeg" else fmt
+        filename = f"{prefix}_{timestamp}.{extension}"
     
-    screenshot_path = os.path.join(SCREENSHOTS_DIR, filename)
+    screenshot_path = screenshots_dir / filename
     
     try:
-        await page.screenshot(path=screenshot_path, full_page=True)
-        logger.debug(f"Screenshot saved: {screenshot_path}")
-        return screenshot_path
+        img_bytes = await page.screenshot(
+            type=fmt,
+            quality=quality if fmt == "jpeg" else None,
+            full_page=full_page
+        )
+        # Write off the event loop so disk I/O doesn't stall the browser session
+        await asyncio.to_thread(screenshot_path.write_bytes, img_bytes)
+        logger.debug("Screenshot saved: {}", screenshot_path)
+        return str(screenshot_path)
     except Exception as e:
         logger.error(f"Failed to take screenshot: {e}")
         return ""
 
 
+def take_screenshot_in_background(
+    page: Page,
+    filename: Optional[str] = None,
+    prefix: str = "error",
+    *,
+    full_page: bool = False
+) -> None:
+    """
+    Schedule a screenshot without waiting for it (for non-fatal warnings).
+    
+    Args:
+        page: Playwright page object
+        filename: Optional custom filename, otherwise auto-generated
+        prefix: Prefix for auto-generated filename
+        full_page: Capture the whole scrollable page instead of the viewport
+    """
+    task = asyncio.create_task(take_screenshot(page, filename, prefix, full_page=full_page))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def wait_for_background_tasks() -> None:
+    """Wait for pending background screenshots before the browser is closed."""
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+
+
+async def _wait_for_element(
+    page: Page,
+    selector: str,
+    timeout: float,
+    state: str
+) -> Optional[Any]:
+    """
+    Wait for a selector through the Locator API and return its first match.
+    
+    Args:
+        page: Playwright page object
+        selector: Selector string
+        timeout: Maximum wait time in milliseconds
+        state: Element state to wait for (visible, hidden, attached, detached)
+        
+    Returns:
+        ElementHandle for visible/attached states, None for hidden/detached
+    """
+    if state == "visible":
+        # Wait for any visible match (not just the first match becoming visible),
+        # which also keeps unions from stalling on a hidden first element
+        selector = f"{selector} >> visible=true"
+    locator = page.locator(selector).first
+    await locator.wait_for(state=state, timeout=timeout)
+    if state in ("hidden", "detached"):
+        return None
+    return await locator.element_handle()
+
+
+_RESOLVE_UNION_JS = """
+([selectors, visibleOnly]) => {
+    const visible = (el) => el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== 'hidden';
+    return selectors.findIndex((sel) => {
+        try {
+            return Array.from(document.querySelectorAll(sel)).some((el) => !visibleOnly || visible(el));
+        } catch (e) {
+            return false;
+        }
+    });
+}
+"""
+
+# How long to keep waiting for higher-priority selectors once a lower one matched
+_PRIORITY_GRACE_SECONDS = 0.5
+
+
+async def _resolve_union(
+    page: Page,
+    selectors: Tuple[str, ...],
+    state: str
+) -> Optional[Tuple[str, Any]]:
+    """
+    Pick the highest-priority selector of a CSS union that currently matches.
+    
+    The union itself returns the first match in DOM order, which says nothing
+    about which selector the group prefers.
+    
+    Args:
+        page: Playwright page object
+        selectors: Selectors the union was built from, in priority order
+        state: Element state that was waited for (visible or attached)
+        
+    Returns:
+        Tuple of (selector, ElementHandle), or None if nothing matches any more
+    """
+    try:
+        index = await page.evaluate(_RESOLVE_UNION_JS, [list(selectors), state == "visible"])
+        if index < 0:
+            return None
+        selector = selectors[index]
+        suffix = " >> visible=true" if state == "visible" else ""
+        element = await page.locator(f"{selector}{suffix}").first.element_handle(timeout=1000)
+        return selector, element
+    except Exception as e:
+        logger.debug("Could not resolve union match: {}", e)
+        return None
+
+
+async def _find_with_fallbacks(
+    page: Page,
+    selectors: Sequence[str],
+    timeout: int = 10,
+    state: str = "visible"
+) -> Tuple[Optional[str], Optional[Any]]:
+    """
+    Wait for multiple selectors concurrently and return the first one found.
+    
+    All selectors are probed in parallel, so a miss costs one timeout instead
+    of one timeout per selector. Once a selector matches, higher-priority
+    selectors get a short grace period to match as well, and the highest
+    priority match wins. Within the CSS union the winner is picked by
+    priority, not DOM order. Priority is best-effort: a preferred element
+    that appears after the grace period loses.
+    
+    Args:
+        page: Playwright page object
+        selectors: Sequence of selector strings to try
+        timeout: Maximum wait time in seconds
+        state: Element state to wait for (visible, hidden, attached, detached)
+        
+    Returns:
+        Tuple of (matching selector, ElementHandle), or (None, None)
+    """
+    ordered = prioritize_selectors(page, selectors)
+    
+    # Probe all plain-CSS selectors as a single union (one browser call)
+    # alongside the Playwright-only selectors that cannot be joined
+    css_selectors = tuple(s for s in ordered if is_plain_css(s))
+    union = None
+    if len(css_selectors) > 1:
+        union = css_union(ordered)
+        probes = []
+        for selector in ordered:
+            if not is_plain_css(selector):
+                probes.append(selector)
+            elif union not in probes:
+                probes.append(union)
+        ordered = tuple(probes)
+    
+    tasks = []
+    for selector in ordered:
+        logger.debug("Trying selector: {}", selector)
+        tasks.append(asyncio.create_task(_wait_for_element(
+            page,
+            selector,
+            timeout=timeout * 1000,  # Convert to milliseconds
+            state=state
+        )))
+    
+    found: Dict[int, Any] = {}
+    
+    def collect(done: Set[asyncio.Task]) -> None:
+        for task in done:
+            index = tasks.index(task)
+            try:
+                element = task.result()
+            except PlaywrightTimeoutError:
+                logger.debug("Selector not found: {}", ordered[index])
+                continue
+            except Exception as e:
+                logger.debug("Error with selector {}: {}", ordered[index], e)
+                continue
+            if element:
+                found[index] = element
+    
+    pending = set(tasks)
+    try:
+        while pending and not found:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            collect(done)
+        
+        if found:
+            # Give the probes ranked above the current best a moment to match too
+            higher = {t for t in pending if tasks.index(t) < min(found)}
+            if higher:
+                done, _ = await asyncio.wait(higher, timeout=_PRIORITY_GRACE_SECONDS)
+                pending -= done
+                collect(done)
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    if not found:
+        logger.warning(f"None of the selectors matched: {selectors}")
+        return None, None
+    
+    best = min(found)
+    selector, element = ordered[best], found[best]
+    if selector == union:
+        resolved = await _resolve_union(page, css_selectors, state)
+        if resolved:
+            selector, element = resolved
+    logger.debug("Found element with selector: {}", selector)
+    return selector, element
+
+
 async def wait_for_selector_with_fallbacks(
     page: Page,
-    selectors: list,
+    selectors: Sequence[str],
     timeout: int = 10,
     state: str = "visible"
 ) -> Optional[Any]:
     """
-    Try multiple selectors in order until one is found.
+    Wait for multiple selectors concurrently and return the element found.
+    
+    Nothing is recorded as the group's winner; callers that act on the
+    element should use remember_selector() once the action succeeded.
     
     Args:
         page: Playwright page object
-        selectors: List of selector strings to try
-        timeout: Maximum wait time per selector
+        selectors: Sequence of selector strings to try
+        timeout: Maximum wait time in seconds
         state: Element state to wait for (visible, hidden, attached, detached)
         
     Returns:
         ElementHandle if found, None otherwise
     """
-    for selector in selectors:
+    _, element = await _find_with_fallbacks(page, selectors, timeout, state)
+    return element
+
+
+async def wait_for_any_visible(
+    page: Page,
+    selectors: Sequence[str],
+    timeout: int = 5
+) -> bool:
+    """
+    Wait until any selector of a group has a visible match.
+    
+    A plain presence check: unlike wait_for_selector_with_fallbacks it does not
+    record a winning selector and does not warn on a miss, so it suits
+    optional elements.
+    
+    Args:
+        page: Playwright page object
+        selectors: Sequence of selector strings
+        timeout: Maximum wait time in seconds
+        
+    Returns:
+        True if a visible match appeared, False otherwise
+    """
+    union = css_union(tuple(selectors))
+    probes = ([union] if union else []) + [s for s in selectors if not is_plain_css(s)]
+    locator = page.locator(f"{probes[0]} >> visible=true")
+    for probe in probes[1:]:
+        locator = locator.or_(page.locator(f"{probe} >> visible=true"))
+    try:
+        await locator.first.wait_for(state="visible", timeout=timeout * 1000)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+    except Exception as e:
+        logger.debug("Error waiting for any of {}: {}", selectors, e)
+        return False
+
+
+async def find_first_visible(
+    page: Page,
+    selectors: Sequence[str]
+) -> Tuple[Optional[str], Optional[Any]]:
+    """
+    Return the highest-priority selector that currently has a visible match.
+    
+    Selectors are checked one by one without waiting, so the group's order
+    decides, not which element happened to render first. Use it for click
+    targets, after wait_for_any_visible() has waited for the group.
+    
+    Args:
+        page: Playwright page object
+        selectors: Sequence of selector strings, most specific first
+        
+    Returns:
+        Tuple of (selector, Locator of its first visible match), or (None, None)
+    """
+    for selector in prioritize_selectors(page, selectors):
+        locator = page.locator(f"{selector} >> visible=true").first
         try:
-            logger.debug(f"Trying selector: {selector}")
-            element = await page.wait_for_selector(
-                selector,
-                timeout=timeout * 1000,  # Convert to milliseconds
-                state=state
-            )
-            if element:
-                logger.debug(f"Found element with selector: {selector}")
-                return element
-        except PlaywrightTimeoutError:
-            logger.debug(f"Selector not found: {selector}")
-            continue
+            if await locator.count():
+                return selector, locator
         except Exception as e:
-            logger.debug(f"Error with selector {selector}: {e}")
-            continue
+            logger.debug("Selector failed: {} - {}", selector, e)
+    return None, None
+
+
+_TYPE_IN_BROWSER_JS = """
+(el, items) => new Promise(async (resolve) => {
+    const sleep = (ms) => new Promise((r) => setTimeout(r, ms));
+    el.focus();
+    for (const [c, d] of items) {
+        document.execCommand('insertText', false, c);
+        await sleep(d);
+    }
+    resolve();
+})
+"""
+
+
+async def type_in_browser(element: Any, text: str, delay_ms: int = TYPING_DELAY_MS) -> None:
+    """
+    Type text character by character inside the browser.
+    
+    Unlike element.type(), which costs one round-trip per character, the
+    whole typing loop runs in a single evaluate call. insertText fires the
+    same input events as real typing, for textareas and contenteditables.
     
-    logger.warning(f"None of the selectors matched: {selectors}")
-    return None
+    Args:
+        element: ElementHandle or Locator to type into
+        text: Text to type
+        delay_ms: Base delay between characters in milliseconds
+    """
+    items = [(c, max(0, delay_ms + random.uniform(-30, 50))) for c in text]
+    await element.evaluate(_TYPE_IN_BROWSER_JS, items)
+
+
+async def install_banner_handler(page: Page) -> bool:
+    """
+    Dismiss the cookie banner automatically whenever it blocks an action.
+    
+    Playwright runs the handler itself before actions when the banner is
+    visible, so the cookie banner selectors no longer need to be probed
+    after every navigation.
+    
+    Args:
+        page: Playwright page object
+        
+    Returns:
+        True if the handler was installed, False otherwise
+    """
+    accept_button = page.get_by_role("button", name=_COOKIE_ACCEPT_RE).first
+    
+    async def _accept() -> None:
+        await accept_button.click()
+        logger.info("Cookie banner accepted")
+    
+    try:
+        await page.add_locator_handler(accept_button, _accept)
+        _banner_handled_pages.add(page)
+        logger.debug("Cookie banner handler installed")
+        return True
+    except Exception as e:
+        logger.debug(f"Could not install cookie banner handler: {e}")
+        return False
+
+
+def has_banner_handler(page: Page) -> bool:
+    """
+    Check whether install_banner_handler() succeeded for this page.
+    
+    Args:
+        page: Playwright page object
+        
+    Returns:
+        True if the cookie banner is handled automatically on this page
+    """
+    return page in _banner_handled_pages
+
+
+async def find_button(
+    page: Page,
+    name_pattern: str,
+    timeout: int = 5
+) -> Optional[Any]:
+    """
+    Find a visible button or link by its accessible name.
+    Uses Playwright's role lookup instead of scanning text with :has-text().
+    
+    Args:
+        page: Playwright page object
+        name_pattern: Case-insensitive regex matched against the accessible name
+        timeout: Maximum wait time in seconds
+        
+    Returns:
+        ElementHandle if found, None otherwise
+    """
+    name = re.compile(name_pattern, re.I)
+    # Filter before .first: a hidden duplicate (mobile menu, sticky header)
+    # earlier in the DOM would otherwise stall the wait
+    locator = page.get_by_role("button", name=name).or_(
+        page.get_by_role("link", name=name)
+    ).filter(visible=True).first
+    
+    try:
+        await locator.wait_for(state="visible", timeout=timeout * 1000)
+        logger.debug("Found button by role: {}", name_pattern)
+        return await locator.element_handle()
+    except PlaywrightTimeoutError:
+        logger.debug("Button not found by role: {}", name_pattern)
+        return None
+    except Exception as e:
+        logger.debug("Error finding button by role {}: {}", name_pattern, e)
+        return None
+
+
+async def wait_success(page: Page, timeout: int = 5) -> bool:
+    """
+    Wait for a success message or success-styled element.
+    
+    Text matches and the CSS entries of SUCCESS_INDICATOR are combined into
+    one locator, so a single wait covers the whole group.
+    
+    Args:
+        page: Playwright page object
+        timeout: Maximum wait time in seconds
+        
+    Returns:
+        True if a success indicator became visible, False otherwise
+    """
+    indicator = page.get_by_text(SUCCESS_INDICATOR_RE).or_(page.locator(SUCCESS_INDICATOR_UNION))
+    try:
+        # Only visible matches count; a hidden one earlier in the DOM must not stall the wait
+        await indicator.filter(visible=True).first.wait_for(state="visible", timeout=timeout * 1000)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+    except Exception as e:
+        logger.debug(f"Error waiting for success indicator: {e}")
+        return False
 
 
 async def retry_with_backoff(
@@ -152,6 +741,9 @@ async def retry_with_backoff(
     """
     Retry a function with exponential backoff.
     
+    Timeouts on a call that received a ``page`` keyword argument are retried as
+    soon as the page reaches network idle, with the backoff as the upper bound.
+    
     Args:
         func: Async function to retry
         max_retries: Maximum number of retry attempts
@@ -166,10 +758,11 @@ async def retry_with_backoff(
         Exception: If all retries fail
     """
     last_exception = None
+    is_coro = asyncio.iscoroutinefunction(func)
     
     for attempt in range(max_retries):
         try:
-            if asyncio.iscoroutinefunction(func):
+            if is_coro:
                 return await func(*args, **kwargs)
             else:
                 return func(*args, **kwargs)
@@ -177,6 +770,19 @@ async def retry_with_backoff(
             last_exception = e
             if attempt < max_retries - 1:
                 wait_time = backoff * (2 ** attempt)
+                page = kwargs.get("page")
+                if isinstance(e, PlaywrightTimeoutError) and page is not None:
+                    # The page is probably still loading: retry as soon as it settles,
+                    # using the backoff only as an upper bound
+                    logger.warning(
+                        f"Attempt {attempt + 1}/{max_retries} timed out: {e}. "
+                        f"Retrying once the page is idle (max {wait_time} seconds)..."
+                    )
+                    try:
+                        await asyncio.wait_for(page.wait_for_load_state("networkidle"), timeout=wait_time)
+                    except Exception:
+                        pass
+                    continue
                 logger.warning(
                     f"Attempt {attempt + 1}/{max_retries} failed: {e}. "
                     f"Retrying in {wait_time} seconds..."
@@ -190,7 +796,7 @@ async def retry_with_backoff(
 
 async def safe_click(
     page: Page,
-    selectors: list,
+    selectors: Sequence[str],
     timeout: int = 10,
     description: str = "element"
 ) -> bool:
@@ -199,19 +805,20 @@ async def safe_click(
     
     Args:
         page: Playwright page object
-        selectors: List of selector strings to try
+        selectors: Sequence of selector strings to try
         timeout: Maximum wait time
         description: Description of element for logging
         
     Returns:
         True if clicked successfully, False otherwise
     """
-    element = await wait_for_selector_with_fallbacks(page, selectors, timeout)
+    selector, element = await _find_with_fallbacks(page, selectors, timeout)
     
     if element:
         try:
             await element.click()
-            logger.debug(f"Clicked {description}")
+            logger.debug("Clicked {}", description)
+            remember_selector(page, selectors, selector)
             return True
         except Exception as e:
             logger.error(f"Failed to click {description}: {e}")
@@ -223,7 +830,7 @@ async def safe_click(
 
 async def safe_fill(
     page: Page,
-    selectors: list,
+    selectors: Sequence[str],
     text: str,
     timeout: int = 10,
     description: str = "input field"
@@ -233,7 +840,7 @@ async def safe_fill(
     
     Args:
         page: Playwright page object
-        selectors: List of selector strings to try
+        selectors: Sequence of selector strings to try
         text: Text to fill
         timeout: Maximum wait time
         description: Description of field for logging
@@ -241,12 +848,13 @@ async def safe_fill(
     Returns:
         True if filled successfully, False otherwise
     """
-    element = await wait_for_selector_with_fallbacks(page, selectors, timeout)
+    selector, element = await _find_with_fallbacks(page, selectors, timeout)
     
     if element:
         try:
             await element.fill(text)
-            logger.debug(f"Filled {description} with: {text[:50]}...")
+            logger.debug("Filled {} with: {}...", description, text[:50])
+            remember_selector(page, selectors, selector)
             return True
         except Exception as e:
             logger.error(f"Failed to fill {description}: {e}")
@@ -258,7 +866,7 @@ async def safe_fill(
 
 async def safe_select(
     page: Page,
-    selectors: list,
+    selectors: Sequence[str],
     value: str,
     timeout: int = 10,
     description: str = "select field"
@@ -268,7 +876,7 @@ async def safe_select(
     
     Args:
         page: Playwright page object
-        selectors: List of selector strings to try
+        selectors: Sequence of selector strings to try
         value: Value to select
         timeout: Maximum wait time
         description: Description of field for logging
@@ -276,12 +884,13 @@ async def safe_select(
     Returns:
         True if selected successfully, False otherwise
     """
-    element = await wait_for_selector_with_fallbacks(page, selectors, timeout)
+    selector, element = await _find_with_fallbacks(page, selectors, timeout)
     
     if element:
         try:
             await element.select_option(value)
-            logger.debug(f"Selected {value} in {description}")
+            logger.debug("Selected {} in {}", value, description)
+            remember_selector(page, selectors, selector)
             return True
         except Exception as e:
             logger.error(f"Failed to select in {description}: {e}")
@@ -291,6 +900,7 @@ async def safe_select(
         return False
 
 
+@lru_cache(maxsize=1024)
 def validate_url(url: str) -> bool:
     """
     Validate that URL is a Kleinanzeigen listing URL.
@@ -303,12 +913,9 @@ def validate_url(url: str) -> bool:
     """
     if not url:
         return False
-    
-    valid_domains = [
-        "kleinanzeigen.de",
-        "www.kleinanzeigen.de",
-    ]
-    
-    return any(domain in url for domain in valid_domains)
-
-
+    try:
+        # Without a scheme urlparse() would read the host as part of the path
+        host = urlparse(url if "//" in url else "//" + url).hostname
+    except ValueError:
+        return False
+    return host is not None and (host == "kleinanzeigen.de" or host.endswith(".kleinanzeigen.de"))